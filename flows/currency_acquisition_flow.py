@@ -47,7 +47,7 @@ def currency_acquisition_flow():
     # ------------------------------------------------------------------
     report   = validate_exchange_rate_data(fx_path, fail_on_issues=True,
                                               include_rate_check=True)
-    coverage = report["checks"]["country_coverage"]["coverage_pct"]
+    coverage = report["checks"]["country_coverage"].get("coverage_pct", "n/a")
     logger.info(
         f"Validation passed — {report['total_rows']} rows, "
         f"{coverage}% IMF country coverage"
@@ -7,6 +7,7 @@ REM  Usage:
 REM    run_cross_validate.bat                          Validate ALL months
 REM    run_cross_validate.bat --sample 24              Validate 24 random months
 REM    run_cross_validate.bat --start 2020-01 --end 2024-12   Specific range
+REM    run_cross_validate.bat --rebuild-cache          Ignore cached IMF rates
 REM
 REM  This compares your stored CSVs against fresh IMF API data
 REM  to detect any rate mismatches, missing countries, or stale data.
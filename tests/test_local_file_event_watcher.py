@@ -0,0 +1,77 @@
+"""
+Polling backoff of the hotfolder watcher.
+
+Run from the repo root:
+    python -m unittest discover tests
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+try:
+    import watcher.local_file_event_watcher as w
+except ImportError:  # prefect not installed
+    w = None
+
+
+class _StopPolling(Exception):
+    pass
+
+
+@unittest.skipIf(w is None, "prefect is not installed")
+class PollingBackoffTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = self._tmp.name
+        self.addCleanup(self._tmp.cleanup)
+
+    def _poll(self, rounds: int, interval: float = 5, on_sleep=None) -> list:
+        """Runs _watch_polling for `rounds` sleeps and returns the delays."""
+        delays = []
+
+        def fake_sleep(seconds):
+            delays.append(seconds)
+            if on_sleep:
+                on_sleep(len(delays))
+            if len(delays) >= rounds:
+                raise _StopPolling
+
+        with mock.patch.object(w.time, "sleep", fake_sleep), \
+             mock.patch.object(w, "_queue_emits"):
+            with self.assertRaises(_StopPolling):
+                w._watch_polling(self.folder, set(), interval)
+        return delays
+
+    def test_empty_manifest_is_not_counted(self):
+        Path(self.folder, "empty_MANIFEST.json").write_bytes(b"")
+        seen = set()
+        with mock.patch.object(w.time, "sleep") as sleep:
+            self.assertEqual(w._scan(self.folder, seen), 0)
+        sleep.assert_not_called()
+        self.assertEqual(seen, set())
+
+    def test_backoff_grows_to_cap_with_unsettled_manifest(self):
+        Path(self.folder, "empty_MANIFEST.json").write_bytes(b"")
+        delays = self._poll(rounds=8)
+        self.assertEqual(delays[:4], [10, 20, 40, w.WATCHER_MAX_POLL_SECONDS])
+        self.assertEqual(delays[-1], w.WATCHER_MAX_POLL_SECONDS)
+
+    def test_new_manifest_resets_backoff(self):
+        manifest = Path(self.folder, "batch_MANIFEST.json")
+
+        def write_after_idle(count):
+            if count == 4:
+                manifest.write_text("{}")
+
+        # The settle pause also goes through time.sleep, so it shows up as
+        # one extra entry (WATCHER_SETTLE_SECONDS) before the reset
+        delays = self._poll(rounds=7, on_sleep=write_after_idle)
+        self.assertEqual(delays[:4], [10, 20, 40, w.WATCHER_MAX_POLL_SECONDS])
+        self.assertEqual(delays[4:6], [w.WATCHER_SETTLE_SECONDS, 5])
+
+
+if __name__ == "__main__":
+    unittest.main()
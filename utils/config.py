@@ -44,6 +44,17 @@ IMF_FLOW_REF        = "IMF.STA,ER"
 IMF_KEY             = ".USD_XDC.PA_RT.M"
 IMF_API_TIMEOUT_SEC = 30
 IMF_START_YEAR      = 2000   # used by historical backfill
+IMF_MAX_WORKERS     = 8      # concurrent IMF requests during cross-validation
+
+# IMF country lists per month, reused by validation runs within the TTL
+IMF_COUNTRY_CACHE_FILE      = VALIDATION_DIR / ".imf_country_cache.json"
+IMF_COUNTRY_CACHE_TTL_HOURS = 24
+
+# IMF monthly rates cached per month; months before last month are treated
+# as final, last month and the current month are re-fetched once the TTL
+# has elapsed (IMF keeps revising the latest published month)
+IMF_RATES_CACHE_DIR         = VALIDATION_DIR / "imf_cache"
+IMF_RATES_CACHE_TTL_HOURS   = 6
 
 # ---------------------------------------------------------------------------
 # REST Countries API settings
@@ -81,6 +92,7 @@ MAX_MONTH_ON_MONTH_CHANGE   = 0.30    # 30% — flag but don't fail
 EXPECTED_MIN_COUNTRY_COUNT  = 50      # below this a month's data is suspicious
 RATE_MISMATCH_TOLERANCE     = 0.001   # 0.1% — tolerance for cross-validation
 BACKFILL_CHUNK_SIZE         = 12      # months per API call (12 = yearly chunks)
+MAX_REPORT_RECORDS          = 100     # cap on per-row samples kept in a JSON report
 
 # ---------------------------------------------------------------------------
 # Scheduling (Europe/Zurich — matches prefect.yaml)
@@ -88,6 +100,15 @@ BACKFILL_CHUNK_SIZE         = 12      # months per API call (12 = yearly chunks)
 
 SCHEDULE_TIMEZONE = "Europe/Zurich"
 
+# ---------------------------------------------------------------------------
+# Hotfolder watcher
+# ---------------------------------------------------------------------------
+
+WATCHER_EMIT_WORKERS   = 8      # threads sending emit_event calls, so a burst goes out concurrently
+WATCHER_EMIT_QUEUE     = 1024   # detected manifests waiting for an emit worker
+WATCHER_SETTLE_SECONDS = 0.2    # a scanned manifest must keep its size this long before it is emitted
+WATCHER_MAX_POLL_SECONDS = 60   # polling mode doubles its interval on quiet polls up to this cap
+
 # ---------------------------------------------------------------------------
 # Helper: ensure all runtime directories exist
 # ---------------------------------------------------------------------------
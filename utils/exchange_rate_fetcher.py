@@ -8,21 +8,36 @@ Enhanced features:
   - Supports single-month AND date-range fetching
   - Chunked bulk fetching (yearly chunks) for 2000->present backfills
   - Currency cache persisted to disk between runs (currency_cache.json)
-  - REST Countries lookups run in parallel (ThreadPoolExecutor)
+  - REST Countries lookups run in parallel (shared ThreadPoolExecutor)
   - All output goes through Prefect logger (not print)
   - Retry on REST Countries API failures (up to 3 attempts)
   - Force-refetch option to overwrite existing CSVs
+  - Parquet copy of every monthly CSV (when pyarrow is installed)
 """
 
 import os
+import gzip
+import atexit
 import json
 import time
 import urllib.request
-import xml.etree.ElementTree as ET
-import pandas as pd
+from xml.parsers import expat
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # pandas is imported lazily inside process_xml_to_dataframe so callers that
+    # only need the date helpers or the currency cache skip its import cost
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to stdlib json when orjson is not installed
+    orjson = None
 
 from utils.config import (
     DATA_DIR,
@@ -36,6 +51,20 @@ from utils.config import (
 )
 
 
+# ---------------------------------------------------------------------------
+# JSON helpers (orjson when available, stdlib json otherwise)
+# ---------------------------------------------------------------------------
+
+def _json_loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Persistent currency cache
 # ---------------------------------------------------------------------------
@@ -43,8 +72,8 @@ from utils.config import (
 def _load_cache() -> dict:
     if CURRENCY_CACHE_FILE.exists():
         try:
-            with open(CURRENCY_CACHE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(CURRENCY_CACHE_FILE, "rb") as f:
+                return _json_loads(f.read())
         except (json.JSONDecodeError, OSError):
             return {}
     return {}
@@ -52,8 +81,8 @@ def _load_cache() -> dict:
 
 def _save_cache(cache: dict):
     CURRENCY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(CURRENCY_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache, f, indent=2, ensure_ascii=False)
+    with open(CURRENCY_CACHE_FILE, "wb") as f:
+        f.write(_json_dumps(cache))
 
 
 # Module-level cache
@@ -105,19 +134,41 @@ def build_month_list(start_year: int, start_month: int,
     return months
 
 
+# ---------------------------------------------------------------------------
+# HTTP helpers
+# ---------------------------------------------------------------------------
+
+def _read_body(resp) -> bytes:
+    """Reads a urllib response body, decompressing it if the server gzipped it."""
+    data = resp.read()
+    if resp.headers.get("Content-Encoding") == "gzip":
+        return gzip.decompress(data)
+    return data
+
+
 # ---------------------------------------------------------------------------
 # REST Countries API - currency code lookup
 # ---------------------------------------------------------------------------
 
+# Process-wide pool for REST Countries lookups; threads are only started on
+# first submit and are reused across resolve_currency_codes() calls.
+_EXECUTOR = ThreadPoolExecutor(max_workers=REST_COUNTRIES_MAX_WORKERS,
+                               thread_name_prefix="rest-countries")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+
 def _fetch_currency_from_api(country_code: str) -> str | None:
     url = f"https://restcountries.com/v3.1/alpha/{country_code}"
-    req = urllib.request.Request(url, headers={"User-Agent": "Python-IMF-Pipeline/2.0"})
+    req = urllib.request.Request(url, headers={
+        "User-Agent":      "Python-IMF-Pipeline/2.0",
+        "Accept-Encoding": "gzip",
+    })
 
     for attempt in range(3):
         try:
             with urllib.request.urlopen(req, timeout=REST_COUNTRIES_TIMEOUT_SEC) as resp:
                 if resp.getcode() == 200:
-                    data = json.loads(resp.read().decode("utf-8"))
+                    data = _json_loads(_read_body(resp))
                     if data and "currencies" in data[0]:
                         return list(data[0]["currencies"].keys())[0]
         except Exception:
@@ -146,13 +197,12 @@ def resolve_currency_codes(country_codes: list, logger=None) -> dict:
         if logger:
             logger.info(f"Fetching currency codes for {len(to_fetch)} new countries...")
 
-        with ThreadPoolExecutor(max_workers=REST_COUNTRIES_MAX_WORKERS) as executor:
-            futures = {executor.submit(_fetch_currency_from_api, code): code for code in to_fetch}
-            for future in as_completed(futures):
-                code = futures[future]
-                currency = future.result()
-                result[code] = currency
-                _currency_cache[code] = currency
+        futures = {_EXECUTOR.submit(_fetch_currency_from_api, code): code for code in to_fetch}
+        for future in as_completed(futures):
+            code = futures[future]
+            currency = future.result()
+            result[code] = currency
+            _currency_cache[code] = currency
 
         _save_cache(_currency_cache)
 
@@ -187,13 +237,16 @@ def get_currency_data_from_imf(start_date: str, end_date: str,
         f"?startPeriod={start_date}&endPeriod={end_date}"
         f"&dimensionAtObservation=TIME_PERIOD&detail=dataonly&includeHistory=false"
     )
-    req = urllib.request.Request(url, headers={"Cache-Control": "no-cache"}, method="GET")
+    req = urllib.request.Request(url, headers={
+        "Cache-Control":   "no-cache",
+        "Accept-Encoding": "gzip",
+    }, method="GET")
 
     for attempt in range(3):
         try:
             with urllib.request.urlopen(req, timeout=effective_timeout) as resp:
                 if resp.getcode() == 200:
-                    return resp.read().decode("utf-8")
+                    return _read_body(resp).decode("utf-8")
                 if logger:
                     logger.warning(f"IMF API returned HTTP {resp.getcode()}")
         except Exception as exc:
@@ -212,62 +265,120 @@ def get_currency_data_from_imf(start_date: str, end_date: str,
 # XML -> DataFrame
 # ---------------------------------------------------------------------------
 
-def process_xml_to_dataframe(xml_data: str, logger=None) -> pd.DataFrame:
+@lru_cache(maxsize=None)
+def _base_currency(indicator: str) -> str:
+    """Maps an IMF INDICATOR (e.g. 'USD_XDC') to its base currency code."""
+    return "USD" if indicator == "USD_XDC" else indicator.split("_")[-1]
+
+
+class _IMFHandler:
+    """
+    expat callbacks that collect IMF SDMX observations without building a tree.
+    Only the Series (COUNTRY, INDICATOR) and Obs (TIME_PERIOD, OBS_VALUE)
+    attributes are read; every other element is ignored.
+    """
+
+    def __init__(self):
+        self.series_data = []
+        self.country     = None
+        self.indicator   = None
+        self.obs_list    = None
+
+    def start_element(self, name: str, attrs: dict):
+        if name == "Obs":
+            if self.obs_list is not None:
+                value = attrs.get("OBS_VALUE")
+                if value is not None:
+                    self.obs_list.append((attrs.get("TIME_PERIOD"), value))
+        elif name == "Series":
+            self.country   = attrs.get("COUNTRY")
+            self.indicator = attrs.get("INDICATOR")
+            self.obs_list  = []
+
+    def end_element(self, name: str):
+        if name == "Series":
+            if self.country and self.obs_list:
+                self.series_data.append((self.country, self.indicator, self.obs_list))
+            self.obs_list = None
+
+
+def _parse_series(xml_data: str | bytes) -> list[tuple]:
+    """Returns [(country, indicator, [(time_period, value), ...]), ...]."""
+    handler = _IMFHandler()
+    parser  = expat.ParserCreate()
+    parser.StartElementHandler = handler.start_element
+    parser.EndElementHandler   = handler.end_element
+    parser.Parse(xml_data, True)
+    return handler.series_data
+
+
+def process_xml_to_dataframe(xml_data: str, logger=None) -> "pd.DataFrame":
     """
     Parses IMF SDMX XML into a clean DataFrame.
     Handles multi-month responses (date ranges).
     """
+    import pandas as pd
+
     try:
-        root = ET.fromstring(xml_data)
-    except ET.ParseError as exc:
+        series_data = _parse_series(xml_data)
+    except expat.ExpatError as exc:
         if logger:
             logger.error(f"XML parse error: {exc}")
         return pd.DataFrame()
 
     fetch_ts = datetime.now().isoformat()
 
-    # First pass - collect all series data
-    series_data = []
-    for series in root.findall(".//Series"):
-        country_code = series.get("COUNTRY")
-        indicator    = series.get("INDICATOR")
-        obs_list     = [
-            (obs.get("TIME_PERIOD"), obs.get("OBS_VALUE"))
-            for obs in series.findall("Obs")
-            if obs.get("OBS_VALUE") is not None
-        ]
-        if country_code and obs_list:
-            series_data.append((country_code, indicator, obs_list))
-
     # Resolve all currency codes in one parallel batch
     all_countries = list({s[0] for s in series_data})
     currency_map  = resolve_currency_codes(all_countries, logger=logger)
 
-    # Second pass - build rows
-    rows = []
+    # Second pass - build rows into a list pre-sized to the exact obs count
+    columns = ["Country", "Currency", "Date", "Exchange_Rate", "Base_Currency", "Timestamp"]
+    rows = [None] * sum(len(obs_list) for _, _, obs_list in series_data)
+    idx = 0
     for country_code, indicator, obs_list in series_data:
-        base_currency = "USD" if indicator == "USD_XDC" else indicator.split("_")[-1]
+        base_currency = _base_currency(indicator)
         official_currency = currency_map.get(country_code)
 
         for time_period, value in obs_list:
-            year_month = time_period.replace("-M", "")
-            rows.append({
-                "Country":       country_code,
-                "Currency":      official_currency,
-                "Date":          year_month,
-                "Exchange_Rate": float(value),
-                "Base_Currency": base_currency,
-                "Timestamp":     fetch_ts,
-            })
+            rows[idx] = (
+                country_code,
+                official_currency,
+                time_period.replace("-M", ""),
+                float(value),
+                base_currency,
+                fetch_ts,
+            )
+            idx += 1
 
     if not rows:
         return pd.DataFrame()
 
-    df = pd.DataFrame(rows)
+    df = pd.DataFrame(rows, columns=columns)
     df["Date"] = pd.to_datetime(df["Date"], format="%Y%m").dt.strftime("%Y%m")
     return df.sort_values(["Country", "Date"]).reset_index(drop=True)
 
 
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def _write_month(df: "pd.DataFrame", csv_path: Path):
+    """
+    Writes one month of rates to csv_path, plus a sibling .parquet file.
+    The CSV stays the canonical output (batch + validation read it); the
+    Parquet copy is skipped silently when pyarrow is not installed, and any
+    older copy is removed so it cannot shadow the new CSV.
+    """
+    parquet_path = csv_path.with_suffix(".parquet")
+    df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+    try:
+        df.to_parquet(parquet_path, index=False,
+                      engine="pyarrow", compression="zstd")
+    except ImportError:
+        parquet_path.unlink(missing_ok=True)
+
+
 # ---------------------------------------------------------------------------
 # Public entry points
 # ---------------------------------------------------------------------------
@@ -301,7 +412,7 @@ def fetch_rates_for_month(year_month_api: str, logger=None,
     if df.empty:
         raise RuntimeError(f"Parsed DataFrame is empty for {year_month_api}")
 
-    df.to_csv(full_path, index=False, encoding="utf-8-sig")
+    _write_month(df, full_path)
     if logger:
         logger.info(f"Saved {len(df)} rows to {full_path}")
 
@@ -326,6 +437,18 @@ def fetch_rates_for_range(start_api: str, end_api: str,
     Returns:
         List of paths to saved CSV files.
     """
+    start_year, start_month = (int(x) for x in start_api.split("-"))
+    end_year, end_month     = (int(x) for x in end_api.split("-"))
+    month_paths = [
+        DATA_DIR / f"exchange_rates_{year}_{month:02d}.csv"
+        for year, month in build_month_list(start_year, start_month, end_year, end_month)
+    ]
+    if month_paths and not force and all(p.exists() for p in month_paths):
+        if logger:
+            logger.info(f"All {len(month_paths)} months for {start_api} -> {end_api} "
+                        f"already exist (skipping fetch)")
+        return [str(p) for p in month_paths]
+
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     if logger:
@@ -351,7 +474,7 @@ def fetch_rates_for_range(start_api: str, end_api: str,
             saved_files.append(str(filepath))
             continue
 
-        month_df.to_csv(filepath, index=False, encoding="utf-8-sig")
+        _write_month(month_df, filepath)
         saved_files.append(str(filepath))
         if logger:
             logger.info(f"  Saved {ym_file}: {len(month_df)} rows")
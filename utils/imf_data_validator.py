@@ -27,81 +27,352 @@ Single month from CLI:
 """
 
 import os
+import copy
 import json
 import random
 import argparse
-import urllib.request
-import xml.etree.ElementTree as ET
+import threading
+import numpy as np
 import pandas as pd
+import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to stdlib json when orjson is not installed
+    orjson = None
+
 from utils.config import (
     DATA_DIR,
-    IMF_FLOW_REF, IMF_KEY, IMF_API_TIMEOUT_SEC,
+    IMF_FLOW_REF, IMF_KEY, IMF_API_TIMEOUT_SEC, IMF_MAX_WORKERS,
     MAX_REASONABLE_RATE, MIN_REASONABLE_RATE,
     MAX_MONTH_ON_MONTH_CHANGE, EXPECTED_MIN_COUNTRY_COUNT,
-    VALIDATION_DIR, IMF_AGGREGATE_CODES, IMF_START_YEAR,
+    VALIDATION_DIR, IMF_AGGREGATE_CODES, IMF_START_YEAR, MAX_REPORT_RECORDS,
+    IMF_COUNTRY_CACHE_FILE, IMF_COUNTRY_CACHE_TTL_HOURS,
+    IMF_RATES_CACHE_DIR, IMF_RATES_CACHE_TTL_HOURS, BACKFILL_CHUNK_SIZE,
 )
+from utils.exchange_rate_fetcher import last_month_api_str
+
+
+# Aggregate codes as a hashed set, built once at import
+_AGG_CODES = frozenset(IMF_AGGREGATE_CODES)
+
+
+# ---------------------------------------------------------------------------
+# JSON helpers (orjson when available, stdlib json otherwise)
+# ---------------------------------------------------------------------------
+
+def _json_loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    if orjson:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
 
 
 # ---------------------------------------------------------------------------
 # Fetch live IMF data
 # ---------------------------------------------------------------------------
 
-def fetch_imf_country_list(year_month_api: str) -> set:
-    """Returns the set of country codes IMF has for 'YYYY-MM'."""
+# Shared keep-alive session for every IMF request, sized for IMF_MAX_WORKERS
+# threads; transient throttling and 5xx responses are retried with backoff
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=16, pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+# In-process copy of the on-disk country list cache: {year_month_api: (fetched_at, countries)}
+_country_list_memo: dict = {}
+# Serialises read-modify-write of the disk cache between threads
+_country_cache_lock = threading.Lock()
+
+
+def _load_country_cache() -> dict:
+    if IMF_COUNTRY_CACHE_FILE.exists():
+        try:
+            return _json_loads(IMF_COUNTRY_CACHE_FILE.read_bytes())
+        except (ValueError, OSError):
+            return {}
+    return {}
+
+
+def _save_country_cache(cache: dict):
+    # Write to a temp file and swap it in, so a concurrent reader never
+    # sees a half-written cache
+    IMF_COUNTRY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = IMF_COUNTRY_CACHE_FILE.with_name(f"{IMF_COUNTRY_CACHE_FILE.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_json_dumps(cache, indent=True))
+    os.replace(tmp_path, IMF_COUNTRY_CACHE_FILE)
+
+
+# Bytes read from the HTTP response per parser feed
+_XML_CHUNK_SIZE = 64 * 1024
+
+
+def _release(elem):
+    """Frees a parsed <Series> and the already-processed siblings before it."""
+    elem.clear()
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+
+def _stream_series(fileobj):
+    """
+    Yields each <Series> element of an SDMX response as soon as it closes.
+    The response is fed to the parser in _XML_CHUNK_SIZE reads, so memory
+    holds one chunk plus the current series; each series is released once
+    the caller moves on to the next.
+    """
+    parser = etree.XMLPullParser(events=("end",), tag="Series")
+    while chunk := fileobj.read(_XML_CHUNK_SIZE):
+        parser.feed(chunk)
+        for _, series in parser.read_events():
+            yield series
+            _release(series)
+    parser.close()
+
+
+def _iter_series(start_api: str, end_api: str, timeout: int,
+                 session: requests.Session = None):
+    """
+    Streams the IMF SDMX data for start_api..end_api ('YYYY-MM') and yields
+    (country, obs) for each <Series> carrying a COUNTRY, where obs iterates
+    that series' <Obs> elements. Consume obs before advancing; the series
+    is released on the next step. Raises on transport errors and non-200
+    responses.
+    """
     url = (
         f"https://api.imf.org/external/sdmx/2.1/data/{IMF_FLOW_REF}/{IMF_KEY}"
-        f"?startPeriod={year_month_api}&endPeriod={year_month_api}"
+        f"?startPeriod={start_api}&endPeriod={end_api}"
         f"&dimensionAtObservation=TIME_PERIOD&detail=dataonly&includeHistory=false"
     )
+    with (session or _session).get(url, timeout=timeout, stream=True,
+                                   headers={"Cache-Control": "no-cache"}) as resp:
+        if resp.status_code != 200:
+            raise requests.HTTPError(f"IMF returned HTTP {resp.status_code}", response=resp)
+        # Parse straight off the socket; let urllib3 undo any gzip
+        resp.raw.decode_content = True
+        for series in _stream_series(resp.raw):
+            country = series.get("COUNTRY")
+            if country:
+                yield country, series.iterchildren("Obs")
+
+
+def _fetch_imf_country_list_live(year_month_api: str) -> set:
+    # Only COUNTRY on each <Series> is needed; observations are never read
     try:
-        req = urllib.request.Request(url, headers={"Cache-Control": "no-cache"})
-        with urllib.request.urlopen(req, timeout=IMF_API_TIMEOUT_SEC) as resp:
-            if resp.getcode() != 200:
-                return set()
-            root = ET.fromstring(resp.read().decode("utf-8"))
-            return {s.get("COUNTRY") for s in root.findall(".//Series") if s.get("COUNTRY")}
+        return {country for country, _ in
+                _iter_series(year_month_api, year_month_api, IMF_API_TIMEOUT_SEC)}
     except Exception:
         return set()
 
 
-def fetch_imf_rates_for_month(year_month_api: str, timeout: int = 60) -> dict:
+def fetch_imf_country_list(year_month_api: str) -> set:
+    """
+    Returns the set of country codes IMF has for 'YYYY-MM'.
+
+    Lists are cached in memory and in IMF_COUNTRY_CACHE_FILE for
+    IMF_COUNTRY_CACHE_TTL_HOURS, so retries and re-runs skip the API call.
+    Failed fetches (empty set) are never cached.
+    """
+    now = datetime.now()
+    ttl = timedelta(hours=IMF_COUNTRY_CACHE_TTL_HOURS)
+
+    hit = _country_list_memo.get(year_month_api)
+    if hit and now - hit[0] < ttl:
+        return set(hit[1])
+
+    entry = _load_country_cache().get(year_month_api)
+    if entry:
+        try:
+            fetched_at = datetime.fromisoformat(entry["fetched_at"])
+            if now - fetched_at < ttl and entry["countries"]:
+                countries = frozenset(entry["countries"])
+                _country_list_memo[year_month_api] = (fetched_at, countries)
+                return set(countries)
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    countries = _fetch_imf_country_list_live(year_month_api)
+    if countries:
+        _country_list_memo[year_month_api] = (now, frozenset(countries))
+        try:
+            with _country_cache_lock:
+                cache = {
+                    ym: e for ym, e in _load_country_cache().items()
+                    if isinstance(e, dict) and e.get("fetched_at", "") >= (now - ttl).isoformat()
+                }
+                cache[year_month_api] = {"fetched_at": now.isoformat(), "countries": sorted(countries)}
+                _save_country_cache(cache)
+        except OSError:
+            pass
+    return countries
+
+
+def fetch_imf_country_lists(year_months: list[str], max_workers: int = IMF_MAX_WORKERS) -> dict:
+    """
+    Fetches IMF country lists for several months concurrently, so a
+    multi-month run waits on the slowest response instead of the sum.
+
+    Returns:
+        dict: {year_month_api: set of country codes} (empty set on failure)
+    """
+    unique = list(dict.fromkeys(year_months))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+        return dict(zip(unique, executor.map(fetch_imf_country_list, unique)))
+
+
+# In-process layer over the on-disk rates cache: {year_month_api: (fetched_at, rates)}
+_rates_memo: dict = {}
+
+
+def _rates_cache_path(year_month_api: str) -> Path:
+    return IMF_RATES_CACHE_DIR / f"{year_month_api}.json"
+
+
+def _rates_fresh(year_month_api: str, fetched_at: datetime) -> bool:
+    # Months before last month are settled. Last month is the one the pipeline
+    # validates while IMF is still publishing and revising it, so it (and the
+    # current month) go stale after the TTL
+    if year_month_api < last_month_api_str():
+        return True
+    return datetime.now() - fetched_at <= timedelta(hours=IMF_RATES_CACHE_TTL_HOURS)
+
+
+def _load_cached_rates(year_month_api: str):
+    """Returns (fetched_at, {country: rate}) from the disk cache, or None."""
+    path = _rates_cache_path(year_month_api)
+    try:
+        fetched_at = datetime.fromtimestamp(path.stat().st_mtime)
+        with open(path, "rb") as f:
+            data = f.read()
+        rates = _json_loads(data)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(rates, dict) or not rates:
+        return None
+    return fetched_at, rates
+
+
+def _save_cached_rates(year_month_api: str, rates: dict):
+    path = _rates_cache_path(year_month_api)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps(rates))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _cached_rates(year_month_api: str):
+    """Fresh cached {country: rate} from memory, then disk; None on a miss."""
+    hit = _rates_memo.get(year_month_api)
+    if hit is None:
+        hit = _load_cached_rates(year_month_api)
+        if hit is None:
+            return None
+        _rates_memo[year_month_api] = hit
+    if not _rates_fresh(year_month_api, hit[0]):
+        return None
+    return dict(hit[1])
+
+
+def _store_rates(year_month_api: str, rates: dict):
+    _rates_memo[year_month_api] = (datetime.now(), dict(rates))
+    _save_cached_rates(year_month_api, rates)
+
+
+def clear_imf_rates_cache() -> int:
+    """Deletes every cached month of IMF rates. Returns the number removed."""
+    _rates_memo.clear()
+    removed = 0
+    for path in IMF_RATES_CACHE_DIR.glob("*.json"):
+        try:
+            path.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def clear_cache():
+    """Drops the in-process IMF and CSV memos; the disk caches are kept."""
+    _country_list_memo.clear()
+    _rates_memo.clear()
+    _mom_memo.clear()
+    _read_rates_cached.cache_clear()
+
+
+def fetch_imf_rates_for_month(year_month_api: str, timeout: int = 60,
+                              session: requests.Session = None,
+                              use_cache: bool = True) -> dict:
     """
     Fetches actual exchange rate values from IMF for a single month.
+    Uses the module's pooled session unless one is passed in.
+
+    Results are cached in memory and under IMF_RATES_CACHE_DIR. Months before
+    last month are served from the cache indefinitely; last month and the
+    current month are re-fetched after IMF_RATES_CACHE_TTL_HOURS. Failed
+    fetches are never cached.
 
     Returns:
         dict: {country_code: exchange_rate} or empty dict on failure.
     """
-    url = (
-        f"https://api.imf.org/external/sdmx/2.1/data/{IMF_FLOW_REF}/{IMF_KEY}"
-        f"?startPeriod={year_month_api}&endPeriod={year_month_api}"
-        f"&dimensionAtObservation=TIME_PERIOD&detail=dataonly&includeHistory=false"
-    )
+    if use_cache:
+        cached = _cached_rates(year_month_api)
+        if cached is not None:
+            return cached
+
+    rates = {}
     try:
-        req = urllib.request.Request(url, headers={"Cache-Control": "no-cache"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            if resp.getcode() != 200:
-                return {}
-            root = ET.fromstring(resp.read().decode("utf-8"))
-
-            rates = {}
-            for series in root.findall(".//Series"):
-                country = series.get("COUNTRY")
-                if not country:
-                    continue
-                for obs in series.findall("Obs"):
-                    val = obs.get("OBS_VALUE")
-                    if val is not None:
-                        try:
-                            rates[country] = float(val)
-                        except ValueError:
-                            pass
-            return rates
+        for country, obs_iter in _iter_series(year_month_api, year_month_api, timeout, session):
+            for obs in obs_iter:
+                val = obs.get("OBS_VALUE")
+                if val is not None:
+                    try:
+                        rates[country] = float(val)
+                    except ValueError:
+                        pass
     except Exception:
         return {}
 
+    if rates and use_cache:
+        _store_rates(year_month_api, rates)
+    return rates
+
+
+def fetch_imf_month(year_month_api: str, include_rates: bool = True) -> tuple[set, dict]:
+    """
+    Fetches the IMF country list and (optionally) the rates for one month
+    concurrently, so single-month validation waits on one round trip.
+
+    Returns:
+        tuple: (set of country codes, {country_code: rate} or None)
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        f_countries = executor.submit(fetch_imf_country_list, year_month_api)
+        f_rates = executor.submit(fetch_imf_rates_for_month, year_month_api) if include_rates else None
+        return f_countries.result(), f_rates.result() if f_rates else None
+
 
 def fetch_imf_rates_for_range(start_api: str, end_api: str,
                                timeout: int = 120) -> dict:
@@ -111,131 +382,305 @@ def fetch_imf_rates_for_range(start_api: str, end_api: str,
     Returns:
         dict: {(country_code, 'YYYYMM'): exchange_rate}
     """
-    url = (
-        f"https://api.imf.org/external/sdmx/2.1/data/{IMF_FLOW_REF}/{IMF_KEY}"
-        f"?startPeriod={start_api}&endPeriod={end_api}"
-        f"&dimensionAtObservation=TIME_PERIOD&detail=dataonly&includeHistory=false"
-    )
+    rates = {}
     try:
-        req = urllib.request.Request(url, headers={"Cache-Control": "no-cache"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            if resp.getcode() != 200:
-                return {}
-            root = ET.fromstring(resp.read().decode("utf-8"))
-
-            rates = {}
-            for series in root.findall(".//Series"):
-                country = series.get("COUNTRY")
-                if not country:
-                    continue
-                for obs in series.findall("Obs"):
-                    period = obs.get("TIME_PERIOD", "").replace("-M", "")
-                    val = obs.get("OBS_VALUE")
-                    if val is not None:
-                        try:
-                            rates[(country, period)] = float(val)
-                        except ValueError:
-                            pass
-            return rates
+        for country, obs_iter in _iter_series(start_api, end_api, timeout):
+            for obs in obs_iter:
+                attrib = obs.attrib
+                val = attrib.get("OBS_VALUE")
+                if val is not None:
+                    period = attrib.get("TIME_PERIOD", "").replace("-M", "")
+                    try:
+                        rates[(country, period)] = float(val)
+                    except ValueError:
+                        pass
     except Exception:
         return {}
+    return rates
+
+
+# ---------------------------------------------------------------------------
+# CSV loading
+# ---------------------------------------------------------------------------
+
+def _read_csv(path, **kwargs) -> pd.DataFrame:
+    """
+    pd.read_csv for the pipeline's utf-8-sig CSVs, using the multi-threaded
+    pyarrow engine when pyarrow is installed and the C engine otherwise.
+    Columns stay NumPy-backed so the checks' array code works either way.
+    """
+    try:
+        return pd.read_csv(path, encoding="utf-8-sig", engine="pyarrow", **kwargs)
+    except ImportError:
+        return pd.read_csv(path, encoding="utf-8-sig", **kwargs)
+
+
+@lru_cache(maxsize=32)
+def _read_rates_cached(path: str, mtime: float) -> pd.DataFrame:
+    df = _read_csv(path, usecols=["Country", "Exchange_Rate"], dtype={"Country": str})
+    df["Exchange_Rate"] = pd.to_numeric(df["Exchange_Rate"], errors="coerce")
+    return df
+
+
+def _read_rates(csv_path) -> pd.DataFrame:
+    """
+    Country + numeric Exchange_Rate from a monthly CSV, parsed once per
+    (path, mtime) so the MoM check and cross-validation share the frame.
+    Callers must treat the result as read-only.
+    """
+    return _read_rates_cached(str(csv_path), os.path.getmtime(csv_path))
 
 
 # ---------------------------------------------------------------------------
 # Individual checks (single-month validation)
 # ---------------------------------------------------------------------------
 
-def _check_coverage(df: pd.DataFrame, imf_countries: set) -> dict:
-    local  = set(df["Country"].dropna().unique())
-    missing = imf_countries - local
-    extra   = local - imf_countries
-    overlap = local & imf_countries
+def _compact(df: pd.DataFrame, cols: list) -> dict:
+    """Row sample in compact form: {"columns": [...], "data": [[...], ...]}."""
+    return {"columns": cols, "data": df[cols].to_records(index=False).tolist()}
+
+
+def _prev_ym(year: int, month: int) -> tuple[int, int]:
+    """Returns (year, month) of the month before the given one."""
+    return (year, month - 1) if month > 1 else (year - 1, 12)
+
+
+def _month_runs(months, max_len: int) -> list[tuple[str, str]]:
+    """
+    Groups 'YYYY-MM' strings into (start, end) runs of consecutive months,
+    each at most max_len months long.
+    """
+    runs = []
+    prev, run_len = None, 0
+    for ym in sorted(months):
+        y, m = _prev_ym(int(ym[:4]), int(ym[5:7]))
+        if prev == f"{y}-{m:02d}" and run_len < max_len:
+            runs[-1] = (runs[-1][0], ym)
+            run_len += 1
+        else:
+            runs.append((ym, ym))
+            run_len = 1
+        prev = ym
+    return runs
+
+
+@lru_cache(maxsize=256)
+def _parse_ym_from_stem(stem: str) -> tuple[int, int]:
+    """Parses (year, month) from an 'exchange_rates_YYYY_MM' stem; raises ValueError otherwise."""
+    parts = stem.split("_")
+    try:
+        year, month = int(parts[-2]), int(parts[-1])
+    except (ValueError, IndexError):
+        raise ValueError(f"Filename does not end in _YYYY_MM: {stem}") from None
+    if not 1 <= month <= 12:
+        raise ValueError(f"Filename does not end in _YYYY_MM: {stem}")
+    return year, month
+
+
+def _month_keys(csv_path: str) -> tuple[str, str]:
+    """
+    Returns (year_month_api 'YYYY-MM', expected_ym 'YYYYMM') for a CSV,
+    falling back to last month when the filename carries no month.
+    """
+    try:
+        year, month = _parse_ym_from_stem(Path(csv_path).stem)
+    except ValueError:
+        today = datetime.today()
+        year, month = _prev_ym(today.year, today.month)
+    return f"{year}-{month:02d}", f"{year}{month:02d}"
+
+
+def _sorted_unique(values: pd.Series) -> list:
+    """Sorted distinct non-null values of a Series, as a plain list."""
+    return np.unique(values.dropna().to_numpy()).tolist()
+
+
+def _agg_mask(countries: pd.Series) -> np.ndarray:
+    """
+    Boolean array marking IMF aggregate codes. A categorical column tests
+    each category once and maps the result through its integer codes.
+    """
+    if isinstance(countries.dtype, pd.CategoricalDtype):
+        # Trailing False is picked up by code -1 (missing country)
+        per_category = np.append(countries.cat.categories.isin(_AGG_CODES), False)
+        return per_category[countries.cat.codes.to_numpy()]
+    return countries.isin(_AGG_CODES).to_numpy()
+
+
+def _check_coverage(df: pd.DataFrame, imf_countries: set, countries=None) -> dict:
+    """countries: pre-computed distinct Country values (computed from df if omitted)."""
+    if countries is None:
+        countries = df["Country"].dropna().unique()
+    if not imf_countries:
+        return {"skipped": "IMF list unavailable", "csv_count": len(countries)}
+    # Two hashtable membership passes: the IMF-side mask yields both the
+    # missing list (already sorted) and the overlap count
+    local   = pd.Index(countries)
+    imf_idx = pd.Index(sorted(imf_countries))
+    in_csv  = imf_idx.isin(local)
+    extra   = local[~local.isin(imf_idx)].sort_values()
     return {
-        "imf_count":               len(imf_countries),
+        "imf_count":               len(imf_idx),
         "csv_count":               len(local),
-        "coverage_pct":            round(len(overlap) / max(len(imf_countries), 1) * 100, 2),
-        "missing_from_csv":        sorted(missing),
-        "extra_in_csv_not_in_imf": sorted(extra),
+        "coverage_pct":            round(int(in_csv.sum()) / max(len(imf_idx), 1) * 100, 2),
+        "missing_from_csv":        imf_idx[~in_csv].tolist(),
+        "extra_in_csv_not_in_imf": extra.tolist(),
     }
 
 
 def _check_null_currencies(df: pd.DataFrame) -> dict:
-    null_mask = df["Currency"].isna() | (df["Currency"].astype(str).str.strip().isin(["None", ""]))
-    bad = df[null_mask]
-    bad = bad[~bad["Country"].isin(IMF_AGGREGATE_CODES)]
-    return {"count": len(bad), "countries": sorted(bad["Country"].unique().tolist())}
+    cur = df["Currency"].to_numpy(dtype=object)
+    null_mask = pd.isna(cur)
+    present   = ~null_mask
+    # Strip and compare the non-null codes as one fixed-width string array
+    null_mask[present] = np.isin(np.char.strip(cur[present].astype(str)), ["None", ""])
+    bad_mask = null_mask & ~_agg_mask(df["Country"])
+    bad = df["Country"].to_numpy(dtype=object)[bad_mask]
+    return {"count": int(bad_mask.sum()), "countries": np.unique(bad[~pd.isna(bad)]).tolist()}
 
 
 def _check_duplicates(df: pd.DataFrame) -> dict:
-    dupes = df[df.duplicated(subset=["Country", "Date"], keep=False)]
+    mask = df.duplicated(subset=["Country", "Date"], keep=False)
+    n = int(mask.sum())
     return {
-        "count":   len(dupes),
-        "records": dupes[["Country", "Date", "Exchange_Rate"]].to_dict("records"),
+        "count":     n,
+        "records":   _compact(df.loc[mask].head(MAX_REPORT_RECORDS),
+                              ["Country", "Date", "Exchange_Rate"]),
+        "truncated": n > MAX_REPORT_RECORDS,
     }
 
 
 def _check_anomalous_rates(df: pd.DataFrame) -> dict:
-    null_r    = df[df["Exchange_Rate"].isna()]
-    zero_neg  = df[df["Exchange_Rate"] <= 0]
-    too_large = df[df["Exchange_Rate"] > MAX_REASONABLE_RATE]
-    too_small = df[(df["Exchange_Rate"] > 0) & (df["Exchange_Rate"] < MIN_REASONABLE_RATE)]
+    # One float array, three comparisons. NaN compares False, so the range
+    # masks already exclude nulls and the four buckets are disjoint.
+    rates   = df["Exchange_Rate"].to_numpy(dtype="float64")
+    null_m  = np.isnan(rates)
+    zneg_m  = rates <= 0
+    large_m = rates > MAX_REASONABLE_RATE
+    small_m = (rates > 0) & (rates < MIN_REASONABLE_RATE)
+
+    pairs = df[["Country", "Exchange_Rate"]]
+    zero_neg, too_large, too_small = (pairs[m] for m in (zneg_m, large_m, small_m))
     return {
-        "null_count":             len(null_r),
-        "null_countries":         sorted(null_r["Country"].unique().tolist()),
+        "null_count":             int(null_m.sum()),
+        "null_countries":         _sorted_unique(pairs["Country"][null_m]),
         "zero_or_neg_count":      len(zero_neg),
-        "zero_or_neg":            zero_neg[["Country", "Exchange_Rate"]].to_dict("records"),
+        "zero_or_neg":            _compact(zero_neg, ["Country", "Exchange_Rate"]),
         "implausibly_large_count": len(too_large),
-        "implausibly_large":       too_large[["Country", "Exchange_Rate"]].to_dict("records"),
+        "implausibly_large":       _compact(too_large, ["Country", "Exchange_Rate"]),
         "implausibly_small_count": len(too_small),
-        "implausibly_small":       too_small[["Country", "Exchange_Rate"]].to_dict("records"),
+        "implausibly_small":       _compact(too_small, ["Country", "Exchange_Rate"]),
     }
 
 
 def _check_date_coverage(df: pd.DataFrame, expected_ym: str) -> dict:
-    wrong = df[df["Date"].astype(str) != expected_ym]
+    # build_report loads Date as str, so compare the raw array directly
+    wrong_mask = df["Date"].to_numpy() != expected_ym
+    wrong = df.loc[wrong_mask, ["Country", "Date"]]
     return {
         "expected":        expected_ym,
         "wrong_count":     len(wrong),
-        "wrong_sample":    wrong[["Country", "Date"]].head(10).to_dict("records"),
+        "wrong_sample":    wrong.head(10).to_dict("records"),
     }
 
 
-def _check_mom_changes(csv_path: str) -> dict:
+def _mom_source(csv_path: Path) -> Path:
+    """
+    The sibling .parquet copy when it is at least as new as the CSV, else the
+    CSV itself. A CSV rewritten without pyarrow, or fixed by hand, must not be
+    shadowed by an older Parquet file.
+    """
+    parquet_path = csv_path.with_suffix(".parquet")
+    try:
+        if parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+            return parquet_path
+    except OSError:
+        pass
+    return csv_path
+
+
+def _load_mom_rates(csv_path: Path) -> pd.DataFrame:
+    """
+    Loads Country + Exchange_Rate for one month, preferring an up-to-date
+    sibling .parquet copy written by the fetcher and falling back to the CSV.
+    """
+    source = _mom_source(csv_path)
+    if source != csv_path:
+        try:
+            return pd.read_parquet(source, columns=["Country", "Exchange_Rate"])
+        except (ImportError, OSError, ValueError):
+            pass
+    return _read_rates(csv_path)
+
+
+# Memo of finished MoM comparisons keyed on the paths and mtimes of both CSVs
+# and the files actually read, so a Prefect retry skips the rework while a
+# rewritten CSV or Parquet copy invalidates its entry
+_mom_memo: dict = {}
+_MOM_MEMO_SIZE = 8
+
+
+def _check_mom_changes(csv_path: str, curr_df: pd.DataFrame = None) -> dict:
+    """
+    Flags currencies that moved more than MAX_MONTH_ON_MONTH_CHANGE against
+    the prior month's file. Pass curr_df (the already-loaded current month)
+    to avoid re-reading csv_path.
+    """
     p = Path(csv_path)
-    parts = p.stem.split("_")
     try:
-        year, month = int(parts[-2]), int(parts[-1])
-    except (ValueError, IndexError):
+        year, month = _parse_ym_from_stem(p.stem)
+    except ValueError:
         return {"skipped": "Filename does not match exchange_rates_YYYY_MM.csv pattern"}
 
-    prev_date = datetime(year, month, 1) - timedelta(days=1)
-    prev_path = p.parent / f"exchange_rates_{prev_date.strftime('%Y_%m')}.csv"
+    prev_y, prev_m = _prev_ym(year, month)
+    prev_path = p.parent / f"exchange_rates_{prev_y}_{prev_m:02d}.csv"
 
     if not prev_path.exists():
         return {"skipped": f"No prior file at {prev_path}"}
 
-    curr = pd.read_csv(csv_path, encoding="utf-8-sig")[["Country", "Exchange_Rate"]]
-    prev = pd.read_csv(prev_path, encoding="utf-8-sig")[["Country", "Exchange_Rate"]]
-    merged = curr.merge(prev, on="Country", suffixes=("_curr", "_prev")).dropna()
-    merged = merged[merged["Exchange_Rate_prev"] != 0].copy()
-    merged["pct_change"] = (
-        (merged["Exchange_Rate_curr"] - merged["Exchange_Rate_prev"]).abs()
-        / merged["Exchange_Rate_prev"]
+    memo_key = tuple(
+        (str(f), os.path.getmtime(f))
+        for f in (p, _mom_source(p), prev_path, _mom_source(prev_path))
     )
-    flagged = merged[merged["pct_change"] > MAX_MONTH_ON_MONTH_CHANGE].copy()
-    flagged["pct_change"] = (flagged["pct_change"] * 100).round(2)
+    if memo_key in _mom_memo:
+        return copy.deepcopy(_mom_memo[memo_key])
 
-    return {
+    if curr_df is not None:
+        curr = curr_df[["Country", "Exchange_Rate"]]
+    else:
+        curr = _load_mom_rates(p)
+    prev = _load_mom_rates(prev_path)
+
+    # Align on Country instead of merging: join the two rate Series by index
+    curr_s = curr.dropna().set_index("Country")["Exchange_Rate"].rename("Exchange_Rate_curr")
+    prev_s = prev.dropna().set_index("Country")["Exchange_Rate"].rename("Exchange_Rate_prev")
+    both = curr_s.to_frame().join(prev_s, how="inner")
+
+    # Percent change on the raw arrays; only the flagged rows become a frame
+    curr_arr = both["Exchange_Rate_curr"].to_numpy(dtype="float64")
+    prev_arr = both["Exchange_Rate_prev"].to_numpy(dtype="float64")
+    valid    = prev_arr != 0
+    pct100   = np.abs(curr_arr - prev_arr) / np.where(valid, prev_arr, 1.0) * 100
+    flag     = valid & (pct100 > MAX_MONTH_ON_MONTH_CHANGE * 100)
+    flagged  = both.loc[flag].assign(pct_change=np.round(pct100[flag], 2))
+
+    result = {
         "compared_against":    str(prev_path),
         "large_movers_count":  len(flagged),
-        "large_movers": flagged[
-            ["Country", "Exchange_Rate_curr", "Exchange_Rate_prev", "pct_change"]
-        ].to_dict("records"),
+        "large_movers": _compact(
+            flagged.reset_index(),
+            ["Country", "Exchange_Rate_curr", "Exchange_Rate_prev", "pct_change"],
+        ),
     }
 
+    _mom_memo[memo_key] = result
+    while len(_mom_memo) > _MOM_MEMO_SIZE:
+        _mom_memo.pop(next(iter(_mom_memo)))
+    return copy.deepcopy(result)
+
 
 def _check_rate_accuracy(df: pd.DataFrame, imf_rates: dict,
-                          tolerance: float = 0.001) -> dict:
+                          tolerance: float = 0.001, top_n: int = None) -> dict:
     """
     Compares CSV exchange rates against live IMF API values.
     Flags mismatches beyond the tolerance threshold.
@@ -244,6 +689,8 @@ def _check_rate_accuracy(df: pd.DataFrame, imf_rates: dict,
         df:         DataFrame from the CSV
         imf_rates:  dict {country_code: rate} from live IMF API
         tolerance:  Relative tolerance for mismatch (default 0.1%)
+        top_n:      Only list the top_n largest mismatches (all if None);
+                    mismatches_count still covers every mismatch
 
     Returns:
         dict with match stats and list of mismatches
@@ -251,53 +698,56 @@ def _check_rate_accuracy(df: pd.DataFrame, imf_rates: dict,
     if not imf_rates:
         return {"skipped": "IMF rates unavailable for comparison"}
 
-    matches = 0
-    mismatches = []
-    checked = 0
-
-    for _, row in df.iterrows():
-        country = row["Country"]
-        csv_rate = row["Exchange_Rate"]
-
-        if country not in imf_rates:
-            continue
-
-        checked += 1
-        imf_rate = imf_rates[country]
-
-        if imf_rate == 0 and csv_rate == 0:
-            matches += 1
-            continue
-
-        if imf_rate == 0:
-            mismatches.append({
-                "country": country,
-                "csv_rate": csv_rate,
-                "imf_rate": imf_rate,
-                "diff_pct": "N/A (IMF=0)",
-            })
-            continue
-
-        diff_pct = abs(csv_rate - imf_rate) / abs(imf_rate)
-
-        if diff_pct <= tolerance:
-            matches += 1
-        else:
-            mismatches.append({
-                "country": country,
-                "csv_rate": round(csv_rate, 6),
-                "imf_rate": round(imf_rate, 6),
-                "diff_pct": round(diff_pct * 100, 4),
-            })
-
+    imf_s = pd.Series(imf_rates, name="imf_rate", dtype="float64")
+    m = df[["Country", "Exchange_Rate"]].join(imf_s, on="Country", how="inner")
+
+    countries = m["Country"].to_numpy(dtype=object)
+    csv_arr   = m["Exchange_Rate"].to_numpy(dtype="float64")
+    imf_arr   = m["imf_rate"].to_numpy(dtype="float64")
+    zero_mask = imf_arr == 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        diff_pct = np.abs(csv_arr - imf_arr) / np.where(zero_mask, 1.0, np.abs(imf_arr))
+    # IMF=0 only matches an exact CSV zero; NaN CSV rates never match
+    match_mask = np.where(zero_mask, csv_arr == 0, diff_pct <= tolerance)
+
+    # Largest differences first; IMF=0 rows rank as 999%, NaN rows last
+    diff_pct100 = np.round(diff_pct * 100, 4)
+    sort_key = np.where(zero_mask, 999.0, diff_pct100)
+    sort_key = np.where(np.isnan(sort_key), -np.inf, sort_key)
+    mm_idx = np.flatnonzero(~match_mask)
+    mismatches_count = len(mm_idx)
+    if top_n is not None and top_n <= 0:
+        mm_idx = mm_idx[:0]
+    elif top_n is not None and mismatches_count > top_n:
+        # Partition out the top_n keys instead of sorting them all; ties at
+        # the cut keep their row order, as the full stable sort would
+        neg  = -sort_key[mm_idx]
+        kth  = np.partition(neg, top_n - 1)[top_n - 1]
+        ties = np.flatnonzero(neg == kth)[:top_n - np.count_nonzero(neg < kth)]
+        mm_idx = mm_idx[np.sort(np.concatenate([np.flatnonzero(neg < kth), ties]))]
+    mm_idx = mm_idx[np.argsort(-sort_key[mm_idx], kind="stable")]
+
+    # Emit the mismatches column-wise, like _compact, straight from the
+    # arrays; IMF=0 rows keep their raw rates and carry no percentage
+    zero_mm  = zero_mask[mm_idx]
+    csv_out  = np.where(zero_mask, csv_arr, np.round(csv_arr, 6))[mm_idx]
+    imf_out  = np.where(zero_mask, imf_arr, np.round(imf_arr, 6))[mm_idx]
+    diff_out = np.where(zero_mm, "N/A (IMF=0)", diff_pct100[mm_idx].astype(object))
+    mismatches = list(zip(countries[mm_idx].tolist(), csv_out.tolist(),
+                          imf_out.tolist(), diff_out.tolist()))
+
+    checked = len(m)
+    matches = int(match_mask.sum())
     return {
         "checked": checked,
         "matches": matches,
-        "mismatches_count": len(mismatches),
+        "mismatches_count": mismatches_count,
         "accuracy_pct": round(matches / max(checked, 1) * 100, 2),
-        "mismatches": sorted(mismatches, key=lambda x: x.get("diff_pct", 0)
-                              if isinstance(x.get("diff_pct"), (int, float)) else 999,
-                              reverse=True),
+        "mismatches": {
+            "columns": ["country", "csv_rate", "imf_rate", "diff_pct"],
+            "data":    mismatches,
+        },
     }
 
 
@@ -306,33 +756,56 @@ def _check_rate_accuracy(df: pd.DataFrame, imf_rates: dict,
 # ---------------------------------------------------------------------------
 
 def build_report(csv_path: str, imf_countries: set, expected_ym: str,
-                 year_month_api: str, include_rate_check: bool = True) -> dict:
+                 year_month_api: str, include_rate_check: bool = True,
+                 imf_rates: dict = None) -> dict:
+    """imf_rates: pre-fetched IMF rates for the month (fetched here if omitted)."""
     if not os.path.exists(csv_path):
         raise FileNotFoundError(f"CSV not found: {csv_path}")
 
-    df = pd.read_csv(csv_path, encoding="utf-8-sig")
-    required = {"Country", "Currency", "Date", "Exchange_Rate", "Base_Currency"}
-    missing_cols = required - set(df.columns)
+    required = ["Country", "Currency", "Date", "Exchange_Rate", "Base_Currency"]
+    header = pd.read_csv(csv_path, encoding="utf-8-sig", nrows=0).columns
+    missing_cols = set(required) - set(header)
     if missing_cols:
         raise ValueError(f"CSV missing columns: {missing_cols}")
+    df = _read_csv(
+        csv_path, usecols=required,
+        dtype={"Country": str, "Currency": str, "Date": str, "Base_Currency": str},
+    )
     df["Exchange_Rate"] = pd.to_numeric(df["Exchange_Rate"], errors="coerce")
-
-    checks = {
-        "country_coverage":       _check_coverage(df, imf_countries),
-        "null_currency_codes":    _check_null_currencies(df),
-        "duplicate_records":      _check_duplicates(df),
-        "anomalous_rates":        _check_anomalous_rates(df),
-        "date_coverage":          _check_date_coverage(df, expected_ym),
-        "month_on_month_changes": _check_mom_changes(csv_path),
+    # ~200 distinct countries: dictionary-encode so isin/duplicated/unique
+    # work on integer codes instead of hashing strings per row
+    df["Country"] = df["Country"].astype("category")
+
+    # Categories are exactly the distinct non-null countries
+    countries = df["Country"].cat.categories
+
+    # The checks only read df, so they run side by side; pandas releases the
+    # GIL in its kernels and the MoM check's disk read overlaps the rest
+    check_fns = {
+        "country_coverage":       lambda: _check_coverage(df, imf_countries, countries),
+        "null_currency_codes":    lambda: _check_null_currencies(df),
+        "duplicate_records":      lambda: _check_duplicates(df),
+        "anomalous_rates":        lambda: _check_anomalous_rates(df),
+        "date_coverage":          lambda: _check_date_coverage(df, expected_ym),
+        "month_on_month_changes": lambda: _check_mom_changes(csv_path, curr_df=df),
     }
+    # A rates fetch still needed for the accuracy check joins the same pool,
+    # so its network wait overlaps the other checks
+    fetch_rates = include_rate_check and imf_rates is None
+    with ThreadPoolExecutor(max_workers=len(check_fns) + fetch_rates) as executor:
+        rates_future = executor.submit(fetch_imf_rates_for_month, year_month_api) if fetch_rates else None
+        futures = {name: executor.submit(fn) for name, fn in check_fns.items()}
+        checks  = {name: future.result() for name, future in futures.items()}
+        if rates_future:
+            imf_rates = rates_future.result()
 
     # Rate accuracy check against live IMF values
     if include_rate_check:
-        imf_rates = fetch_imf_rates_for_month(year_month_api)
         checks["rate_accuracy"] = _check_rate_accuracy(df, imf_rates)
 
     issues = []
-    if checks["country_coverage"]["missing_from_csv"]:
+    # A skipped coverage check (IMF list unavailable) is not a failure
+    if checks["country_coverage"].get("missing_from_csv"):
         n = len(checks["country_coverage"]["missing_from_csv"])
         issues.append(f"{n} countries present in IMF but missing from CSV")
     if checks["null_currency_codes"]["count"]:
@@ -375,8 +848,8 @@ def save_report(report: dict, prefix: str = "validation") -> str:
     ts   = datetime.now().strftime("%Y%m%d_%H%M%S")
     ym = report.get("year_month", "unknown").replace("-", "_")
     path = VALIDATION_DIR / f"{prefix}_{ym}_{ts}.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    with open(path, "wb") as f:
+        f.write(_json_dumps(report, indent=True))
     return str(path)
 
 
@@ -389,8 +862,11 @@ def print_summary(report: dict):
     print(f"\n{'='*60}")
     print(f"  IMF Validation  {icon}  |  {report['csv_file']}")
     print(f"{'='*60}")
-    print(f"  Rows: {report['total_rows']}  |  Coverage: {cov['csv_count']}/{cov['imf_count']} ({cov['coverage_pct']}%)")
-    if cov["missing_from_csv"]:
+    if "skipped" in cov:
+        print(f"  Rows: {report['total_rows']}  |  Coverage: skipped ({cov['skipped']})")
+    else:
+        print(f"  Rows: {report['total_rows']}  |  Coverage: {cov['csv_count']}/{cov['imf_count']} ({cov['coverage_pct']}%)")
+    if cov.get("missing_from_csv"):
         print(f"  Missing countries : {', '.join(cov['missing_from_csv'])}")
     null_c = report["checks"]["null_currency_codes"]
     if null_c["count"]:
@@ -404,8 +880,8 @@ def print_summary(report: dict):
             print(f"  Rate accuracy: {ra['accuracy_pct']}% ({ra['matches']}/{ra['checked']} match IMF)")
             if ra["mismatches_count"]:
                 print(f"  Rate mismatches: {ra['mismatches_count']}")
-                for m in ra["mismatches"][:5]:
-                    print(f"    {m['country']}: CSV={m['csv_rate']}, IMF={m['imf_rate']} ({m['diff_pct']}% diff)")
+                for country, csv_rate, imf_rate, diff_pct in ra["mismatches"]["data"][:5]:
+                    print(f"    {country}: CSV={csv_rate}, IMF={imf_rate} ({diff_pct}% diff)")
 
     if "large_movers_count" in mom:
         print(f"  MoM large movers  : {mom['large_movers_count']}")
@@ -436,14 +912,13 @@ def cross_validate_historical(start_api: str = None, end_api: str = None,
 
     For each month:
       1. Loads the stored CSV
-      2. Fetches live rates from IMF API
+      2. Fetches live rates from IMF API (one range request, per-month
+         requests only for months missing from the range response)
       3. Compares every country's rate
       4. Flags mismatches beyond tolerance
 
     Returns a comprehensive cross-validation report.
     """
-    import time
-
     # Find all available CSVs
     all_csvs = sorted(DATA_DIR.glob("exchange_rates_[0-9][0-9][0-9][0-9]_[0-9][0-9].csv"))
     if not all_csvs:
@@ -452,12 +927,11 @@ def cross_validate_historical(start_api: str = None, end_api: str = None,
     # Filter by date range if specified
     csv_months = {}
     for csv_path in all_csvs:
-        parts = csv_path.stem.split("_")
         try:
-            ym_api = f"{parts[-2]}-{parts[-1]}"
-            csv_months[ym_api] = csv_path
-        except (ValueError, IndexError):
+            year, month = _parse_ym_from_stem(csv_path.stem)
+        except ValueError:
             continue
+        csv_months[f"{year}-{month:02d}"] = csv_path
 
     if start_api and end_api:
         filtered = {k: v for k, v in csv_months.items()
@@ -473,58 +947,86 @@ def cross_validate_historical(start_api: str = None, end_api: str = None,
     if logger:
         logger.info(f"Cross-validating {len(months_to_check)} months against IMF API...")
 
-    results = []
     total_checked = 0
     total_matches = 0
     total_mismatches = 0
     failed_fetches = []
+    month_results = {}
 
-    for idx, ym_api in enumerate(months_to_check, 1):
-        csv_path = filtered[ym_api]
-        if logger:
-            logger.info(f"  [{idx}/{len(months_to_check)}] Validating {ym_api}...")
-
-        # Load local CSV
+    # Load local CSVs first so only months with usable data hit the API
+    frames = {}
+    for ym_api in months_to_check:
         try:
-            df = pd.read_csv(csv_path, encoding="utf-8-sig")
-            df["Exchange_Rate"] = pd.to_numeric(df["Exchange_Rate"], errors="coerce")
+            frames[ym_api] = _read_rates(filtered[ym_api])
         except Exception as exc:
-            results.append({"month": ym_api, "status": "csv_error", "error": str(exc)})
-            continue
-
-        # Fetch live rates from IMF
-        imf_rates = fetch_imf_rates_for_month(ym_api, timeout=60)
-        if not imf_rates:
-            failed_fetches.append(ym_api)
-            results.append({"month": ym_api, "status": "imf_fetch_failed"})
-            continue
-
-        # Compare
-        accuracy = _check_rate_accuracy(df, imf_rates, tolerance=tolerance)
-
-        month_result = {
-            "month": ym_api,
-            "status": "validated",
-            "csv_rows": len(df),
-            "csv_countries": df["Country"].nunique(),
-            "imf_countries": len(imf_rates),
-            "checked": accuracy["checked"],
-            "matches": accuracy["matches"],
-            "mismatches_count": accuracy["mismatches_count"],
-            "accuracy_pct": accuracy["accuracy_pct"],
-        }
-
-        if accuracy["mismatches"]:
-            month_result["mismatches"] = accuracy["mismatches"][:10]  # top 10
-
-        results.append(month_result)
-        total_checked += accuracy["checked"]
-        total_matches += accuracy["matches"]
-        total_mismatches += accuracy["mismatches_count"]
-
-        # Rate limit
-        if idx < len(months_to_check):
-            time.sleep(0.5)
+            month_results[ym_api] = {"month": ym_api, "status": "csv_error", "error": str(exc)}
+
+    # Serve what the rates cache has, then fetch the remaining months with one
+    # range request per run of consecutive months (capped like the backfill),
+    # so a sparse sample never downloads the gaps between its months
+    prefetched = {}
+    for ym_api in frames:
+        cached = _cached_rates(ym_api)
+        if cached is not None:
+            prefetched[ym_api] = cached
+    pending = [ym_api for ym_api in frames if ym_api not in prefetched]
+    if pending:
+        runs = _month_runs(pending, BACKFILL_CHUNK_SIZE)
+        if logger:
+            logger.info(f"Fetching IMF rates for {len(pending)} months in {len(runs)} range requests...")
+        by_month = {}
+        with ThreadPoolExecutor(max_workers=min(IMF_MAX_WORKERS, len(runs))) as executor:
+            for run_rates in executor.map(lambda run: fetch_imf_rates_for_range(*run), runs):
+                for (country, period), rate in run_rates.items():
+                    by_month.setdefault(f"{period[:4]}-{period[4:]}", {})[country] = rate
+        for ym_api in pending:
+            if by_month.get(ym_api):
+                prefetched[ym_api] = by_month[ym_api]
+                _store_rates(ym_api, by_month[ym_api])
+
+    def _fetch(ym_api):
+        if ym_api in prefetched:
+            return ym_api, prefetched[ym_api]
+        return ym_api, fetch_imf_rates_for_month(ym_api, timeout=60, session=_session)
+
+    # Months the range response lacked (truncated or failed) fall back to
+    # concurrent per-month requests; each month is compared in this thread
+    # as its rates arrive
+    with ThreadPoolExecutor(max_workers=max(1, min(IMF_MAX_WORKERS, len(frames)))) as executor:
+        for idx, (ym_api, imf_rates) in enumerate(executor.map(_fetch, frames), 1):
+            if logger:
+                logger.info(f"  [{idx}/{len(frames)}] Validating {ym_api}...")
+
+            if not imf_rates:
+                failed_fetches.append(ym_api)
+                month_results[ym_api] = {"month": ym_api, "status": "imf_fetch_failed"}
+                continue
+
+            # Compare
+            df = frames[ym_api]
+            accuracy = _check_rate_accuracy(df, imf_rates, tolerance=tolerance, top_n=10)
+
+            month_result = {
+                "month": ym_api,
+                "status": "validated",
+                "csv_rows": len(df),
+                "csv_countries": df["Country"].nunique(),
+                "imf_countries": len(imf_rates),
+                "checked": accuracy["checked"],
+                "matches": accuracy["matches"],
+                "mismatches_count": accuracy["mismatches_count"],
+                "accuracy_pct": accuracy["accuracy_pct"],
+            }
+
+            if accuracy["mismatches_count"]:
+                month_result["mismatches"] = accuracy["mismatches"]  # top 10
+
+            month_results[ym_api] = month_result
+            total_checked += accuracy["checked"]
+            total_matches += accuracy["matches"]
+            total_mismatches += accuracy["mismatches_count"]
+
+    results = [month_results[ym_api] for ym_api in months_to_check]
 
     # Build summary
     validated = [r for r in results if r["status"] == "validated"]
@@ -608,23 +1110,16 @@ try:
         logger = get_run_logger()
         logger.info(f"Validating: {csv_path}")
 
-        stem  = Path(csv_path).stem
-        parts = stem.split("_")
-        try:
-            year_month_api = f"{parts[-2]}-{parts[-1]}"
-            expected_ym    = parts[-2] + parts[-1]
-        except IndexError:
-            lm = (datetime.today().replace(day=1) - timedelta(days=1))
-            year_month_api = lm.strftime("%Y-%m")
-            expected_ym    = lm.strftime("%Y%m")
-
-        logger.info(f"Fetching IMF country list for {year_month_api}...")
-        imf_countries = fetch_imf_country_list(year_month_api)
+        year_month_api, expected_ym = _month_keys(csv_path)
+
+        logger.info(f"Fetching IMF data for {year_month_api}...")
+        imf_countries, imf_rates = fetch_imf_month(year_month_api, include_rate_check)
         if not imf_countries:
             logger.warning("IMF country list unavailable - coverage check skipped")
 
         report      = build_report(csv_path, imf_countries, expected_ym,
-                                    year_month_api, include_rate_check=include_rate_check)
+                                    year_month_api, include_rate_check=include_rate_check,
+                                    imf_rates=imf_rates)
         report_path = save_report(report)
         logger.info(f"Report saved: {report_path}")
 
@@ -635,7 +1130,7 @@ try:
 
         if report["overall_status"] == "PASS":
             logger.info(f"Validation PASSED - {report['total_rows']} rows, "
-                        f"{report['checks']['country_coverage']['coverage_pct']}% coverage")
+                        f"{report['checks']['country_coverage'].get('coverage_pct', 'n/a')}% coverage")
         else:
             msg = f"Validation FAILED - {len(report['issues'])} issue(s)"
             logger.error(msg)
@@ -666,19 +1161,12 @@ except ImportError:
     # Allow running without Prefect installed (CLI mode)
     def validate_exchange_rate_data(csv_path: str, fail_on_issues: bool = True,
                                      include_rate_check: bool = True) -> dict:
-        stem  = Path(csv_path).stem
-        parts = stem.split("_")
-        try:
-            year_month_api = f"{parts[-2]}-{parts[-1]}"
-            expected_ym    = parts[-2] + parts[-1]
-        except IndexError:
-            lm = (datetime.today().replace(day=1) - timedelta(days=1))
-            year_month_api = lm.strftime("%Y-%m")
-            expected_ym    = lm.strftime("%Y%m")
-
-        imf_countries = fetch_imf_country_list(year_month_api)
+        year_month_api, expected_ym = _month_keys(csv_path)
+
+        imf_countries, imf_rates = fetch_imf_month(year_month_api, include_rate_check)
         return build_report(csv_path, imf_countries, expected_ym,
-                            year_month_api, include_rate_check=include_rate_check)
+                            year_month_api, include_rate_check=include_rate_check,
+                            imf_rates=imf_rates)
 
     def cross_validate_historical_task(*args, **kwargs):
         return cross_validate_historical(*args, **kwargs)
@@ -704,8 +1192,13 @@ if __name__ == "__main__":
                     help="Validate a random sample of N months")
     ap.add_argument("--tolerance", type=float, default=0.001,
                     help="Rate mismatch tolerance (default: 0.001 = 0.1%%)")
+    ap.add_argument("--rebuild-cache", action="store_true", default=False,
+                    help="Discard cached IMF rates and re-fetch from the API")
     args = ap.parse_args()
 
+    if args.rebuild_cache:
+        print(f"Cleared {clear_imf_rates_cache()} cached IMF month(s)")
+
     if args.cross_validate:
         print(f"Running cross-validation...")
         report = cross_validate_historical(
@@ -717,22 +1210,15 @@ if __name__ == "__main__":
         print(f"Full report: {report_path}")
 
     elif args.csv:
-        stem  = Path(args.csv).stem
-        parts = stem.split("_")
-        try:
-            year_month_api = f"{parts[-2]}-{parts[-1]}"
-            expected_ym    = parts[-2] + parts[-1]
-        except IndexError:
-            lm = (datetime.today().replace(day=1) - timedelta(days=1))
-            year_month_api = lm.strftime("%Y-%m")
-            expected_ym    = lm.strftime("%Y%m")
+        year_month_api, expected_ym = _month_keys(args.csv)
 
-        print(f"Fetching IMF country list for {year_month_api}...")
-        imf_countries = fetch_imf_country_list(year_month_api)
+        print(f"Fetching IMF data for {year_month_api}...")
+        imf_countries, imf_rates = fetch_imf_month(year_month_api, not args.no_rate_check)
 
         report = build_report(args.csv, imf_countries, expected_ym,
                               year_month_api,
-                              include_rate_check=not args.no_rate_check)
+                              include_rate_check=not args.no_rate_check,
+                              imf_rates=imf_rates)
         report_path = save_report(report)
         print_summary(report)
         print(f"Full report: {report_path}")
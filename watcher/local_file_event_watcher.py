@@ -10,58 +10,502 @@ script in a separate terminal alongside the Prefect worker:
 
     python watcher/local_file_event_watcher.py
 
+On Linux the hotfolder is watched with inotify, so the watcher sleeps until
+a manifest is written. Other platforms (or a failed inotify setup) fall back
+to polling the folder every few seconds. To embed the watcher in a process
+that already runs an asyncio loop, schedule watcher_async() as a task.
+
+Emitted manifest names are kept in .watcher_seen.sqlite inside the hotfolder,
+so restarting the watcher does not re-trigger batches still waiting there.
+
 The Prefect Cloud automation should listen for:
     event:    "local.manifest.created"
     resource: prefect.deployment.name = "process-batch/process-batch"
 """
 
 import os
+import sys
 import time
+import queue
+import atexit
+import asyncio
+import logging
+import ctypes
+import select
+import struct
+import sqlite3
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from prefect.events import emit_event
-from utils.config import HOT_DIR
+from utils.config import (
+    HOT_DIR, WATCHER_EMIT_QUEUE, WATCHER_EMIT_WORKERS, WATCHER_MAX_POLL_SECONDS,
+    WATCHER_SETTLE_SECONDS,
+)
+
+
+MANIFEST_SUFFIX = "_MANIFEST.json"
+_SUFFIX_LEN     = len(MANIFEST_SUFFIX)
+_SUFFIX_BYTES   = os.fsencode(MANIFEST_SUFFIX)
+# Names already emitted, kept inside the hotfolder so a restart does not
+# re-emit manifests that are still waiting to be processed
+SEEN_DB_NAME    = ".watcher_seen.sqlite"
+
+# inotify constants from <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008   # writer closed the file: manifest is complete
+_IN_MOVED_FROM  = 0x00000040   # file renamed out of the folder
+_IN_MOVED_TO    = 0x00000080   # file renamed into the folder
+_IN_DELETE      = 0x00000200   # file deleted (core_processor removes processed manifests)
+_IN_Q_OVERFLOW  = 0x00004000   # kernel queue overflowed, events were dropped
+_IN_IGNORED     = 0x00008000   # watch removed (folder deleted or unmounted)
+_IN_CLOEXEC     = 0o2000000
+# struct inotify_event header: int wd; uint32 mask, cookie, len
+_INOTIFY_EVENT = struct.Struct("iIII")
+
+# Each emit_event is a round trip to Prefect Cloud. Detection only queues new
+# manifests; the emit workers send them, so a slow or throttled call never
+# delays spotting the next manifest, and a burst goes out concurrently.
+_emit_queue: queue.Queue = queue.Queue(maxsize=WATCHER_EMIT_QUEUE)
+_emit_workers: list = []
+
+logger = logging.getLogger("watcher")
+_log_listener: QueueListener | None = None
+
+# Shared by the emit workers and the scan thread, so writes are serialised
+_seen_db: sqlite3.Connection | None = None
+_seen_db_lock = threading.Lock()
+
+
+def _setup_logging():
+    """
+    Sends watcher logs through a QueueHandler: detection and emit threads only
+    enqueue the record, and the listener thread formats and writes it.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(message)s"))
+    _log_listener = QueueListener(records, stream)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    logger.addHandler(QueueHandler(records))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def _open_seen(watch_folder: str) -> set:
+    """Opens the seen store in watch_folder and returns the names it holds."""
+    global _seen_db
+    try:
+        db = sqlite3.connect(os.path.join(watch_folder, SEEN_DB_NAME),
+                             check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS seen (name TEXT PRIMARY KEY)")
+        names = {row[0] for row in db.execute("SELECT name FROM seen")}
+    except sqlite3.Error as exc:
+        logger.warning(f"Seen store unavailable ({exc}) - a restart will re-emit pending manifests")
+        return set()
+
+    with _seen_db_lock:
+        if _seen_db is not None:
+            _seen_db.close()
+        _seen_db = db
+    return names
+
+
+def _write_seen(sql: str, names):
+    if not names or _seen_db is None:
+        return
+    with _seen_db_lock:
+        try:
+            with _seen_db:
+                _seen_db.executemany(sql, ((name,) for name in names))
+        except sqlite3.Error as exc:
+            logger.error(f"Seen store write failed ({exc})")
+
+
+def _remember(names):
+    _write_seen("INSERT OR IGNORE INTO seen (name) VALUES (?)", names)
+
+
+def _forget(names):
+    _write_seen("DELETE FROM seen WHERE name = ?", names)
+
+
+def _recreate_folder(watch_folder: str, seen: set):
+    """Recreates a removed hotfolder and starts a fresh seen store in it."""
+    HOT_DIR.mkdir(parents=True, exist_ok=True)
+    seen.clear()
+    seen.update(_open_seen(watch_folder))
+
+
+def _emit_manifest(filename: str, filepath: str):
+    logger.info(f"Detected new manifest: {filepath}")
+
+    emit_event(
+        event="local.manifest.created",
+        resource={
+            "prefect.resource.id": f"manifest:{filename}",
+            "file_path":           filepath,
+            "event_type":          "manifest_ready",
+        },
+    )
+    logger.info(f"Event emitted for: {filename}")
+
+
+def _emit_one(item: tuple) -> bool:
+    filename, filepath = item
+    try:
+        _emit_manifest(filename, filepath)
+        return True
+    except Exception as exc:
+        logger.error(f"Watcher error: {exc}")
+        return False
+
+
+def _emit_worker():
+    while True:
+        item = _emit_queue.get()
+        if _emit_one(item):
+            # Only emitted manifests count as seen after a restart
+            _remember((item[0],))
+        _emit_queue.task_done()
+
+
+def _start_emit_workers():
+    """Starts the emit worker threads once per process."""
+    while len(_emit_workers) < WATCHER_EMIT_WORKERS:
+        worker = threading.Thread(target=_emit_worker, daemon=True,
+                                  name=f"watcher-emit-{len(_emit_workers)}")
+        worker.start()
+        _emit_workers.append(worker)
+
+
+def _queue_emits(batch: list):
+    """Hands the (filename, filepath) pairs from one scan or event drain to the emit workers."""
+    for item in batch:
+        try:
+            _emit_queue.put_nowait(item)
+        except queue.Full:
+            # Back-pressure rather than dropping: a dropped name would stay in
+            # `seen` and never be emitted
+            logger.warning(f"Emit queue full - waiting to queue {item[0]}")
+            _emit_queue.put(item)
+
+
+def _settled(candidates: list) -> list:
+    """
+    Keeps the (name, path, size) candidates whose size is unchanged after a
+    short pause. batch_prepare writes manifests in place, so a scan can catch
+    one half-written; it is left for the next scan, or for its IN_CLOSE_WRITE
+    event in inotify mode.
+    """
+    time.sleep(WATCHER_SETTLE_SECONDS)
+    ready = []
+    for name, path, size in candidates:
+        try:
+            if os.stat(path).st_size == size:
+                ready.append((name, path))
+        except FileNotFoundError:
+            pass
+    return ready
+
+
+def _scan(watch_folder: str, seen: set) -> int:
+    """
+    Emits every manifest in the folder that has not been seen yet, then
+    forgets names no longer present, so `seen` only ever holds manifests
+    still waiting in the hotfolder. Returns the number of new non-empty
+    manifests found, including any still being written. Empty manifests are
+    skipped (and not counted) until they have content, so an abandoned
+    zero-byte file costs no settle pause and does not hold off the polling
+    backoff.
+    """
+    # scandir yields names and d_type straight from readdir, and entry.path
+    # is built in C, so a pass over a large folder costs no extra stat calls.
+    # Scanning with a bytes path skips decoding every name; only manifests
+    # are decoded. The suffix test runs for every entry: a length compare
+    # rejects short temp names outright, and a slice compare skips endswith
+    suflen, suffix, fsdecode = _SUFFIX_LEN, _SUFFIX_BYTES, os.fsdecode
+    present = {}
+    with os.scandir(os.fsencode(watch_folder)) as it:
+        for entry in it:
+            raw = entry.name
+            if len(raw) > suflen and raw[-suflen:] == suffix:
+                present[fsdecode(raw)] = entry
+
+    # Diff the snapshot against `seen` with set operations (C loops) rather
+    # than one `in` test per manifest; a steady-state pass finds nothing new
+    gone = seen - present.keys()
+    if gone:
+        seen -= gone
+        _forget(gone)
+
+    candidates = []
+    for name in present.keys() - seen:
+        entry = present[name]
+        if entry.is_file(follow_symlinks=False):
+            try:
+                size = entry.stat(follow_symlinks=False).st_size
+            except FileNotFoundError:
+                continue
+            if size:
+                candidates.append((name, fsdecode(entry.path), size))
+
+    if candidates:
+        batch = _settled(candidates)
+        seen.update(name for name, _ in batch)
+        _queue_emits(batch)
+    return len(candidates)
+
+
+def _open_inotify(watch_folder: str) -> int:
+    """Returns an inotify fd watching watch_folder for completed files."""
+    libc = ctypes.CDLL(None, use_errno=True)
+    fd = libc.inotify_init1(_IN_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+    mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_DELETE | _IN_MOVED_FROM
+    if libc.inotify_add_watch(fd, os.fsencode(watch_folder), mask) < 0:
+        errno = ctypes.get_errno()
+        os.close(fd)
+        raise OSError(errno, f"inotify_add_watch failed for {watch_folder}")
+    return fd
+
+
+def _parse_inotify(buf: bytes) -> list:
+    """
+    Splits one read from the inotify fd into (mask, filename) events for
+    manifests only; filename is None for a queue overflow. Raises
+    FileNotFoundError once the watched folder goes away.
+    """
+    events = []
+    offset = 0
+    while offset < len(buf):
+        _, mask, _, length = _INOTIFY_EVENT.unpack_from(buf, offset)
+        offset += _INOTIFY_EVENT.size
+        name = buf[offset:offset + length].rstrip(b"\0")
+        offset += length
+
+        if mask & _IN_IGNORED:
+            raise FileNotFoundError("Watched folder removed")
+        if mask & _IN_Q_OVERFLOW:
+            events.append((mask, None))
+        elif len(name) > _SUFFIX_LEN and name[-_SUFFIX_LEN:] == _SUFFIX_BYTES:
+            events.append((mask, os.fsdecode(name)))
+    return events
+
+
+def _read_inotify(fd: int, timeout: float):
+    """
+    Waits on the inotify fd and yields, per wake-up, the list of events read
+    in one go, or None when nothing arrived within `timeout` seconds.
+    """
+    with select.epoll() as ep:
+        ep.register(fd, select.EPOLLIN)
+        while True:
+            if not ep.poll(timeout):
+                yield None
+                continue
+            yield _parse_inotify(os.read(fd, 64 * 1024))
+
+
+def _apply_events(events: list | None, watch_folder: str, seen: set) -> bool:
+    """
+    Emits the new manifests among `events` and returns True when the folder
+    needs a full rescan: after a quiet interval (events is None) or a queue
+    overflow.
+    """
+    rescan = events is None
+    prefix = os.path.join(watch_folder, "")
+    batch = []
+    for mask, filename in events or ():
+        if filename is None:
+            logger.warning("inotify queue overflowed - rescanning hotfolder")
+            rescan = True
+        elif mask & (_IN_DELETE | _IN_MOVED_FROM):
+            # Processed and archived: forget it so `seen` stays small
+            if filename in seen:
+                seen.discard(filename)
+                _forget((filename,))
+        elif filename not in seen:
+            seen.add(filename)
+            batch.append((filename, prefix + filename))
+    _queue_emits(batch)
+    return rescan
+
+
+def _watch_inotify(watch_folder: str, seen: set, interval: int):
+    """
+    Event-driven loop; raises OSError if inotify cannot be set up. The process
+    stays dormant in epoll until an event arrives, and runs a reconcile scan
+    whenever `interval` seconds pass quietly in case an event was missed.
+    Errors after setup are logged and the watch is re-armed, so only a failed
+    setup ever falls back to polling.
+    """
+    fd = _open_inotify(watch_folder)
+    while True:
+        try:
+            # Pick up manifests written before the watch existed
+            _scan(watch_folder, seen)
+            for events in _read_inotify(fd, interval):
+                if _apply_events(events, watch_folder, seen):
+                    _scan(watch_folder, seen)
+        except FileNotFoundError:
+            # Folder was removed — recreate it and watch again
+            _recreate_folder(watch_folder, seen)
+        except Exception as exc:
+            logger.error(f"Watcher error: {exc}")
+            time.sleep(interval)
+        finally:
+            os.close(fd)
+
+        fd = None
+        while fd is None:
+            try:
+                fd = _open_inotify(watch_folder)
+            except OSError as exc:
+                logger.error(f"Could not re-arm inotify watch: {exc}")
+                time.sleep(interval)
+
+
+async def _watch_inotify_async(watch_folder: str, seen: set, interval: int):
+    """
+    Same loop as _watch_inotify, driven by the running event loop: the fd is
+    registered with loop.add_reader, so no thread is parked on it. Scans and
+    emits still block, so they run in a worker thread; the reader callback
+    only queues raw reads, which keeps `seen` touched by one task at a time.
+    """
+    loop = asyncio.get_running_loop()
+    fd = _open_inotify(watch_folder)
+    while True:
+        reads: asyncio.Queue = asyncio.Queue()
+        loop.add_reader(fd, lambda fd=fd: reads.put_nowait(os.read(fd, 64 * 1024)))
+        try:
+            await asyncio.to_thread(_scan, watch_folder, seen)
+            while True:
+                try:
+                    events = _parse_inotify(await asyncio.wait_for(reads.get(), interval))
+                except asyncio.TimeoutError:
+                    events = None
+                if await asyncio.to_thread(_apply_events, events, watch_folder, seen):
+                    await asyncio.to_thread(_scan, watch_folder, seen)
+        except FileNotFoundError:
+            _recreate_folder(watch_folder, seen)
+        except Exception as exc:
+            logger.error(f"Watcher error: {exc}")
+            await asyncio.sleep(interval)
+        finally:
+            loop.remove_reader(fd)
+            os.close(fd)
+
+        fd = None
+        while fd is None:
+            try:
+                fd = _open_inotify(watch_folder)
+            except OSError as exc:
+                logger.error(f"Could not re-arm inotify watch: {exc}")
+                await asyncio.sleep(interval)
+
+
+def _poll_delay(interval: int, idle_rounds: int) -> float:
+    """
+    Doubles the poll interval for each consecutive poll that found nothing,
+    capped at WATCHER_MAX_POLL_SECONDS, so a quiet hotfolder is listed once a
+    minute instead of every few seconds.
+    """
+    return min(interval * 2 ** idle_rounds, max(interval, WATCHER_MAX_POLL_SECONDS))
+
+
+def _watch_polling(watch_folder: str, seen: set, interval: int):
+    idle_rounds = 0
+    while True:
+        found = 0
+        try:
+            found = _scan(watch_folder, seen)
+        except FileNotFoundError:
+            # Folder was temporarily unavailable — recreate and continue
+            _recreate_folder(watch_folder, seen)
+        except Exception as exc:
+            logger.error(f"Watcher error: {exc}")
+
+        # Any new manifest resets to the base interval; the cap on
+        # idle_rounds only keeps the power of two small
+        idle_rounds = 0 if found else min(idle_rounds + 1, 16)
+        time.sleep(_poll_delay(interval, idle_rounds))
 
 
 def watcher(interval: int = 5):
     """
-    Polls HOT_DIR every `interval` seconds for new *_MANIFEST.json files.
-    Emits a Prefect event for each new file detected.
+    Watches HOT_DIR for new *_MANIFEST.json files and emits a Prefect event
+    for each one. Uses inotify on Linux, with a reconcile scan after
+    `interval` idle seconds; elsewhere, or if inotify is not available,
+    polls every `interval` seconds, backing off while the folder is quiet.
     """
+    _setup_logging()
     watch_folder = str(HOT_DIR)
-    print(f"Starting hotfolder watcher...")
-    print(f"Monitoring: {watch_folder}")
-    print(f"Poll interval: {interval}s")
+    logger.info("Starting hotfolder watcher...")
+    logger.info(f"Monitoring: {watch_folder}")
 
     # Ensure the folder exists before watching
     HOT_DIR.mkdir(parents=True, exist_ok=True)
 
-    seen: set = set()
+    seen = _open_seen(watch_folder)
+    _start_emit_workers()
 
-    while True:
+    if sys.platform.startswith("linux"):
         try:
-            for filename in os.listdir(watch_folder):
-                if filename.endswith("_MANIFEST.json") and filename not in seen:
-                    filepath = os.path.join(watch_folder, filename)
-                    seen.add(filename)
-
-                    print(f"Detected new manifest: {filepath}")
-
-                    emit_event(
-                        event="local.manifest.created",
-                        resource={
-                            "prefect.resource.id": f"manifest:{filename}",
-                            "file_path":           filepath,
-                            "event_type":          "manifest_ready",
-                        },
-                    )
-                    print(f"Event emitted for: {filename}")
+            logger.info("Mode: inotify")
+            _watch_inotify(watch_folder, seen, interval)
+        except (OSError, AttributeError) as exc:
+            # AttributeError: libc without inotify symbols (e.g. some musl builds)
+            logger.warning(f"inotify unavailable ({exc}) - falling back to polling")
 
+    logger.info(f"Poll interval: {interval}s (backing off to {WATCHER_MAX_POLL_SECONDS}s when idle)")
+    _watch_polling(watch_folder, seen, interval)
+
+
+async def watcher_async(interval: int = 5):
+    """
+    Coroutine version of watcher(), for running the watcher inside an
+    existing asyncio process alongside other tasks. Behaves the same way:
+    inotify on Linux with a reconcile scan every `interval` idle seconds,
+    polling with asyncio.sleep elsewhere.
+    """
+    _setup_logging()
+    watch_folder = str(HOT_DIR)
+    logger.info("Starting hotfolder watcher (asyncio)...")
+    logger.info(f"Monitoring: {watch_folder}")
+
+    HOT_DIR.mkdir(parents=True, exist_ok=True)
+
+    seen = _open_seen(watch_folder)
+    _start_emit_workers()
+
+    if sys.platform.startswith("linux"):
+        try:
+            logger.info("Mode: inotify")
+            await _watch_inotify_async(watch_folder, seen, interval)
+        except (OSError, AttributeError) as exc:
+            logger.warning(f"inotify unavailable ({exc}) - falling back to polling")
+
+    logger.info(f"Poll interval: {interval}s (backing off to {WATCHER_MAX_POLL_SECONDS}s when idle)")
+    idle_rounds = 0
+    while True:
+        found = 0
+        try:
+            found = await asyncio.to_thread(_scan, watch_folder, seen)
         except FileNotFoundError:
-            # Folder was temporarily unavailable — recreate and continue
-            HOT_DIR.mkdir(parents=True, exist_ok=True)
+            _recreate_folder(watch_folder, seen)
         except Exception as exc:
-            print(f"Watcher error: {exc}")
+            logger.error(f"Watcher error: {exc}")
 
-        time.sleep(interval)
+        idle_rounds = 0 if found else min(idle_rounds + 1, 16)
+        await asyncio.sleep(_poll_delay(interval, idle_rounds))
 
 
 if __name__ == "__main__":